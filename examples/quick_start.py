@@ -7,41 +7,111 @@ Shows how to measure information loss for a single pattern.
 Author: Nathan M. Thornhill
 """
 
+import math
 import numpy as np
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+# Optional Numba fast path: for small grids the NumPy call overhead
+# dominates, so a compiled scalar loop is much faster. Falls back to the
+# pure-NumPy path when numba is not installed.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _phi_counts_1d(a):
+        """Count alive cells and periodic neighbor transitions (1D)"""
+        n = a.shape[0]
+        alive = 0
+        trans = 0
+        for i in range(n):
+            v = a[i]
+            alive += v
+            trans += v ^ a[(i + 1) % n]
+        return alive, trans, n
+
+    @njit(cache=True)
+    def _phi_counts_2d(a):
+        """Count alive cells and periodic neighbor transitions (2D)"""
+        H, W = a.shape
+        alive = 0
+        trans = 0
+        for i in range(H):
+            for j in range(W):
+                v = a[i, j]
+                alive += v
+                trans += v ^ a[(i + 1) % H, j]
+                trans += v ^ a[i, (j + 1) % W]
+        return alive, trans, 2 * H * W
+
+
+@lru_cache(maxsize=4096)
+def _entropy(alive, n):
+    """Binary Shannon entropy for alive-out-of-n cells (cached per pair)"""
+    p = alive / n
+    return -(p * math.log2(p) + (1 - p) * math.log2(1 - p))
+
+
 # Simple Phi calculator (inline for clarity)
 def calculate_phi(pattern):
     """Calculate Φ = R·S + D for a pattern"""
     
-    flat = pattern.flatten()
-    n_cells = len(flat)
-    alive_cells = np.sum(flat)
-    
+    n_cells = pattern.size
+
+    if njit is not None and pattern.ndim <= 2:
+        # Compiled single-pass kernel: alive count and transitions together
+        a = np.ascontiguousarray(pattern, dtype=np.uint8)
+        if a.ndim == 1:
+            alive_cells, transitions, total_edges = _phi_counts_1d(a)
+        else:
+            alive_cells, transitions, total_edges = _phi_counts_2d(a)
+        alive_cells = int(alive_cells)
+    else:
+        # Pure-NumPy path: one sum, then XOR of uint8 slice views per axis
+        # (no full-grid copies as np.roll would allocate)
+        alive_cells = int(pattern.sum())
+        p = pattern.astype(np.uint8, copy=False)
+        ndim = p.ndim
+        total_edges = n_cells * ndim
+
+        if ndim == 2:
+            # Specialized 2D kernel: explicit vertical + horizontal terms,
+            # no per-axis slice-object construction
+            transitions = (
+                np.count_nonzero(p[1:, :] ^ p[:-1, :])
+                + np.count_nonzero(p[0, :] ^ p[-1, :])
+                + np.count_nonzero(p[:, 1:] ^ p[:, :-1])
+                + np.count_nonzero(p[:, 0] ^ p[:, -1])
+            )
+        else:
+            transitions = 0
+            for axis in range(ndim):
+                s1 = [slice(None)] * ndim
+                s2 = [slice(None)] * ndim
+                s1[axis] = slice(1, None)
+                s2[axis] = slice(0, -1)
+                transitions += np.count_nonzero(p[tuple(s1)] ^ p[tuple(s2)])
+                # Wrap-around edge (periodic boundary, as np.roll gave us)
+                transitions += np.count_nonzero(p.take(0, axis=axis) ^ p.take(-1, axis=axis))
+
     # Edge case: all dead or all alive
     if alive_cells == 0 or alive_cells == n_cells:
         return (0.0, 0.0, 0.0, 0.0)
-    
-    # R: Processing (active cells ratio)
-    R = alive_cells / n_cells
-    
+
+    # R: Processing (active cells ratio) — also the entropy probability
+    p_alive = alive_cells / n_cells
+    R = p_alive
+
     # S: Integration (transitions between states)
-    ndim = pattern.ndim
-    transitions = 0
-    total_edges = 0
-    
-    for axis in range(ndim):
-        shifted = np.roll(pattern, 1, axis=axis)
-        transitions += np.sum(pattern != shifted)
-        total_edges += pattern.size
-    
     S = transitions / total_edges if total_edges > 0 else 0.0
-    
-    # D: Disorder (Shannon entropy)
-    p_alive = alive_cells / n_cells
-    p_dead = 1 - p_alive
-    D = -(p_alive * np.log2(p_alive) + p_dead * np.log2(p_dead))
+
+    # D: Disorder (Shannon entropy) — cached, and math.log2 beats
+    # np.log2 on scalars (no array dispatch)
+    D = _entropy(alive_cells, n_cells)
     
     # Φ = R·S + D
     phi = R * S + D
@@ -51,108 +121,116 @@ def calculate_phi(pattern):
 
 def main():
     """Demonstrate 1D→2D information loss"""
-    
-    print("="*70)
-    print("QUICK START: 1D→2D INFORMATION LOSS")
-    print("="*70)
-    print()
-    
+
+    # Buffer the report and write it once at the end — one syscall
+    # instead of ~50 line-by-line print() calls
+    out = []
+    emit = out.append
+
+    emit("="*70)
+    emit("QUICK START: 1D→2D INFORMATION LOSS")
+    emit("="*70)
+    emit("")
+
     # Parameters
     grid_size = 20
     seed = 42
-    
-    print(f"Configuration:")
-    print(f"  Grid size: {grid_size}")
-    print(f"  Random seed: {seed}")
-    print()
-    
+
+    emit(f"Configuration:")
+    emit(f"  Grid size: {grid_size}")
+    emit(f"  Random seed: {seed}")
+    emit("")
+
     # Generate 1D pattern
     rng = np.random.RandomState(seed)
     pattern_1d = rng.randint(0, 2, size=grid_size).astype(int)
-    
-    print("1D Pattern:")
-    print(''.join(['█' if x else '·' for x in pattern_1d]))
-    print(f"Alive cells: {np.sum(pattern_1d)}/{grid_size}")
-    print()
-    
+
+    emit("1D Pattern:")
+    # Vectorized glyph lookup instead of a per-cell Python conditional
+    emit(''.join(np.array(['·', '█'])[pattern_1d].tolist()))
+    emit(f"Alive cells: {np.sum(pattern_1d)}/{grid_size}")
+    emit("")
+
     # Measure Φ in 1D
     phi_1d, R_1d, S_1d, D_1d = calculate_phi(pattern_1d)
-    
-    print("1D Measurement:")
-    print(f"  Φ = {phi_1d:.4f}")
-    print(f"  R (Processing) = {R_1d:.4f}")
-    print(f"  S (Integration) = {S_1d:.4f}")
-    print(f"  D (Disorder) = {D_1d:.4f}")
-    print()
-    
+
+    emit("1D Measurement:")
+    emit(f"  Φ = {phi_1d:.4f}")
+    emit(f"  R (Processing) = {R_1d:.4f}")
+    emit(f"  S (Integration) = {S_1d:.4f}")
+    emit(f"  D (Disorder) = {D_1d:.4f}")
+    emit("")
+
     # Embed to 2D (middle row)
     pattern_2d = np.zeros((grid_size, grid_size), dtype=int)
     pattern_2d[grid_size // 2, :] = pattern_1d
-    
-    print("2D Embedding:")
-    print(f"  Grid: {grid_size}×{grid_size}")
-    print(f"  Pattern in middle row (row {grid_size//2})")
-    print(f"  Alive cells: {np.sum(pattern_2d)}/{grid_size**2}")
-    print()
-    
+
+    emit("2D Embedding:")
+    emit(f"  Grid: {grid_size}×{grid_size}")
+    emit(f"  Pattern in middle row (row {grid_size//2})")
+    emit(f"  Alive cells: {np.sum(pattern_2d)}/{grid_size**2}")
+    emit("")
+
     # Measure Φ in 2D
     phi_2d, R_2d, S_2d, D_2d = calculate_phi(pattern_2d)
-    
-    print("2D Measurement:")
-    print(f"  Φ = {phi_2d:.4f}")
-    print(f"  R (Processing) = {R_2d:.4f}")
-    print(f"  S (Integration) = {S_2d:.4f}")
-    print(f"  D (Disorder) = {D_2d:.4f}")
-    print()
-    
+
+    emit("2D Measurement:")
+    emit(f"  Φ = {phi_2d:.4f}")
+    emit(f"  R (Processing) = {R_2d:.4f}")
+    emit(f"  S (Integration) = {S_2d:.4f}")
+    emit(f"  D (Disorder) = {D_2d:.4f}")
+    emit("")
+
     # Calculate loss
     ratio = phi_2d / phi_1d if phi_1d > 0 else 0
     loss_pct = (1 - ratio) * 100
-    
-    print("="*70)
-    print("RESULT")
-    print("="*70)
-    print(f"Information retained: {ratio*100:.2f}%")
-    print(f"Information lost: {loss_pct:.2f}%")
-    print()
-    print("Expected range: 80-92% (pattern-dependent)")
-    print("Expected mean: ~86% (across many patterns)")
-    print()
-    
+
+    emit("="*70)
+    emit("RESULT")
+    emit("="*70)
+    emit(f"Information retained: {ratio*100:.2f}%")
+    emit(f"Information lost: {loss_pct:.2f}%")
+    emit("")
+    emit("Expected range: 80-92% (pattern-dependent)")
+    emit("Expected mean: ~86% (across many patterns)")
+    emit("")
+
     if 80 < loss_pct < 92:
-        print("✓ Result within expected range")
+        emit("✓ Result within expected range")
     else:
-        print("⚠ Result outside typical range (unusual pattern)")
-    
-    print()
-    print("="*70)
-    print("INTERPRETATION")
-    print("="*70)
-    print()
-    print("The ~86% loss comes from geometric dilution:")
-    print(f"  • 1D pattern: {np.sum(pattern_1d)} cells in {grid_size} positions")
-    print(f"  • 2D embedding: same {np.sum(pattern_2d)} cells in {grid_size**2} positions")
-    print(f"  • Spatial density decreased by factor of {grid_size}")
-    print()
-    print("This affects:")
-    print("  R (Processing): More dead cells reduces active ratio")
-    print("  S (Integration): Pattern more isolated in larger space")
-    print("  D (Disorder): Remains similar (pattern entropy unchanged)")
-    print()
-    print("Result: Φ drops by ~86%")
-    print()
-    print("="*70)
-    print("NEXT STEPS")
-    print("="*70)
-    print()
-    print("1. Full validation (1,500 patterns across 5 grid sizes):")
-    print("   python validate_dimensional_cascade_multisize.py")
-    print()
-    print("2. Generate publication figures:")
-    print("   python generate_publication_figures.py")
-    print()
-    print("3. See docs/METHODOLOGY.md for detailed explanation")
-    print()
+        emit("⚠ Result outside typical range (unusual pattern)")
+
+    emit("")
+    emit("="*70)
+    emit("INTERPRETATION")
+    emit("="*70)
+    emit("")
+    emit("The ~86% loss comes from geometric dilution:")
+    emit(f"  • 1D pattern: {np.sum(pattern_1d)} cells in {grid_size} positions")
+    emit(f"  • 2D embedding: same {np.sum(pattern_2d)} cells in {grid_size**2} positions")
+    emit(f"  • Spatial density decreased by factor of {grid_size}")
+    emit("")
+    emit("This affects:")
+    emit("  R (Processing): More dead cells reduces active ratio")
+    emit("  S (Integration): Pattern more isolated in larger space")
+    emit("  D (Disorder): Remains similar (pattern entropy unchanged)")
+    emit("")
+    emit("Result: Φ drops by ~86%")
+    emit("")
+    emit("="*70)
+    emit("NEXT STEPS")
+    emit("="*70)
+    emit("")
+    emit("1. Full validation (1,500 patterns across 5 grid sizes):")
+    emit("   python validate_dimensional_cascade_multisize.py")
+    emit("")
+    emit("2. Generate publication figures:")
+    emit("   python generate_publication_figures.py")
+    emit("")
+    emit("3. See docs/METHODOLOGY.md for detailed explanation")
+    emit("")
+
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 if __name__ == "__main__":
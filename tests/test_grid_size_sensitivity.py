@@ -13,7 +13,10 @@ Date: January 13, 2026
 """
 
 import numpy as np
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 import json
 from datetime import datetime
@@ -23,7 +26,10 @@ from scipy import stats
 parent_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(parent_dir))
 
-from validate_dimensional_cascade_unified import PhiCalculator
+from validate_dimensional_cascade_multisize import PhiCalculator
+
+# Single calculator reused across all patterns (stateless per call)
+PHI_CALC = PhiCalculator()
 
 
 # ============================================================================
@@ -32,9 +38,11 @@ from validate_dimensional_cascade_unified import PhiCalculator
 
 def generate_pattern_1d(grid_size, seed):
     """Generate random 1D pattern"""
-    np.random.seed(seed)
-    density = np.random.uniform(0.3, 0.6)
-    return np.random.choice([0, 1], size=grid_size, p=[1-density, density])
+    # Local Generator: no process-global RNG state, and a plain threshold
+    # comparison replaces the slower two-value np.random.choice
+    rng = np.random.default_rng(seed)
+    density = rng.uniform(0.3, 0.6)
+    return (rng.random(grid_size) < density).astype(np.int8)
 
 
 # ============================================================================
@@ -44,7 +52,8 @@ def generate_pattern_1d(grid_size, seed):
 def embed_1d_to_2d(grid_1d, y_size):
     """Embed 1D pattern into middle row of 2D grid"""
     x = grid_1d.shape[0]
-    grid_2d = np.zeros((x, y_size), dtype=int)
+    # int8 matches the generated patterns and is 8x smaller than int64
+    grid_2d = np.zeros((x, y_size), dtype=np.int8)
     y_mid = y_size // 2
     grid_2d[:, y_mid] = grid_1d
     return grid_2d
@@ -55,9 +64,8 @@ def embed_1d_to_2d(grid_1d, y_size):
 # ============================================================================
 
 def measure_phi(grid):
-    """Measure Φ using PhiCalculator"""
-    phi_calc = PhiCalculator()
-    phi, R, S, D = phi_calc.calculate_phi(grid)
+    """Measure Φ using the shared PhiCalculator"""
+    phi, R, S, D = PHI_CALC.calculate_phi(grid)
     return phi, R, S, D
 
 
@@ -95,6 +103,39 @@ def test_1d_to_2d_size(pattern_id, grid_size, seed_start=6000):
     }
 
 
+def run_size_batch(grid_size, n_per_size, seed_start=6000):
+    """Measure Φ loss for all patterns of one grid size in batched calls.
+
+    Top-level (picklable) so it can run in a worker process.
+    """
+    # Stack all patterns and measure Φ in one batched call, amortizing
+    # the per-pattern Python overhead across the whole size
+    pats_1d = np.stack([
+        generate_pattern_1d(grid_size, seed_start + i)
+        for i in range(n_per_size)
+    ])
+    pats_2d = np.stack([embed_1d_to_2d(p, grid_size) for p in pats_1d])
+
+    phi_1d, _, _, _ = PHI_CALC.calculate_phi_batch(pats_1d)
+    phi_2d, _, _, _ = PHI_CALC.calculate_phi_batch(pats_2d)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio_phi = np.where(phi_1d > 0, phi_2d / phi_1d, 0.0)
+    loss_pct = (1 - ratio_phi) * 100
+
+    return [
+        {
+            'pattern_id': i,
+            'grid_size': grid_size,
+            'loss_pct': float(loss_pct[i]),
+            'ratio_phi': float(ratio_phi[i]),
+            'phi_1d': float(phi_1d[i]),
+            'phi_2d': float(phi_2d[i])
+        }
+        for i in range(n_per_size)
+    ]
+
+
 def run_grid_size_validation(grid_sizes=[15, 20, 25], n_per_size=20):
     """Test multiple grid sizes"""
     print("=" * 70)
@@ -107,20 +148,19 @@ def run_grid_size_validation(grid_sizes=[15, 20, 25], n_per_size=20):
     
     all_results = {}
     
-    for grid_size in grid_sizes:
-        print(f"Testing grid size {grid_size}...")
-        results = []
-        
-        for i in range(n_per_size):
-            result = test_1d_to_2d_size(i, grid_size)
-            results.append(result)
-        
-        all_results[grid_size] = results
-        
-        # Quick stats
-        losses = [r['loss_pct'] for r in results]
-        mean_loss = np.mean(losses)
-        print(f"  → Mean loss: {mean_loss:.1f}%")
+    # Each grid size is independent; run them across worker processes
+    # (the per-pattern work inside each is already batched)
+    with ProcessPoolExecutor(max_workers=min(len(grid_sizes), os.cpu_count() or 1)) as ex:
+        size_results = ex.map(
+            partial(run_size_batch, n_per_size=n_per_size), grid_sizes
+        )
+        for grid_size, results in zip(grid_sizes, size_results):
+            all_results[grid_size] = results
+
+            # Quick stats
+            losses = [r['loss_pct'] for r in results]
+            mean_loss = np.mean(losses)
+            print(f"Grid size {grid_size}: mean loss {mean_loss:.1f}%")
     
     print()
     print("=" * 70)
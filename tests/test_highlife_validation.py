@@ -29,7 +29,10 @@ from scipy import stats
 parent_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(parent_dir))
 
-from validate_dimensional_cascade_unified import PhiCalculator
+from validate_dimensional_cascade_multisize import PhiCalculator
+
+# Single calculator reused across all patterns (stateless per call)
+PHI_CALC = PhiCalculator()
 
 
 # ============================================================================
@@ -38,9 +41,11 @@ from validate_dimensional_cascade_unified import PhiCalculator
 
 def generate_pattern_2d(grid_size, seed):
     """Generate random 2D pattern"""
-    np.random.seed(seed)
-    density = np.random.uniform(0.3, 0.6)
-    return np.random.choice([0, 1], size=(grid_size, grid_size), p=[1-density, density])
+    # Local Generator: no process-global RNG state, and a plain threshold
+    # comparison replaces the slower two-value np.random.choice
+    rng = np.random.default_rng(seed)
+    density = rng.uniform(0.3, 0.6)
+    return (rng.random((grid_size, grid_size)) < density).astype(np.int8)
 
 
 # ============================================================================
@@ -50,7 +55,8 @@ def generate_pattern_2d(grid_size, seed):
 def embed_2d_to_3d(grid_2d, z_size):
     """Embed 2D pattern into middle slice of 3D grid"""
     x, y = grid_2d.shape
-    grid_3d = np.zeros((x, y, z_size), dtype=int)
+    # int8 matches the generated patterns and is 8x smaller than int64
+    grid_3d = np.zeros((x, y, z_size), dtype=np.int8)
     z_mid = z_size // 2
     grid_3d[:, :, z_mid] = grid_2d
     return grid_3d
@@ -61,9 +67,8 @@ def embed_2d_to_3d(grid_2d, z_size):
 # ============================================================================
 
 def measure_phi(grid):
-    """Measure Φ using PhiCalculator"""
-    phi_calc = PhiCalculator()
-    phi, R, S, D = phi_calc.calculate_phi(grid)
+    """Measure Φ using the shared PhiCalculator"""
+    phi, R, S, D = PHI_CALC.calculate_phi(grid)
     return phi, R, S, D
 
 
@@ -0,0 +1,101 @@
+"""
+REGRESSION TEST: HISTOGRAM FAST-PATH EQUIVALENCE
+================================================
+
+The figure generator draws histograms through _bar_hist, which has two
+counting paths:
+1. fast_histogram.histogram1d (when installed) — pure-C scale-and-bincount
+2. a NumPy scale-and-bincount fallback
+
+Both must reproduce np.histogram's counts exactly, including samples that
+sit exactly on the top edge: every call site passes hi = data max (or
+defaults to it), and histogram1d's range is top-edge exclusive, so a
+mismatch there silently drops the maximum-value samples from the plots.
+
+Author: Nathan M. Thornhill
+Date: August 31, 2026
+"""
+
+import numpy as np
+import sys
+from pathlib import Path
+
+# Import from parent directory
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+import generate_publication_figures as gpf
+
+
+class _CountingAx:
+    """Stand-in axes that just records the counts handed to ax.bar"""
+
+    def bar(self, left, counts, width, align, **bar_kwargs):
+        self.counts = np.asarray(counts, dtype=np.float64)
+
+
+def bar_hist_counts(arr, bins, lo=None, hi=None):
+    """Run _bar_hist and return the counts it would have drawn"""
+    ax = _CountingAx()
+    gpf._bar_hist(ax, arr, bins, lo=lo, hi=hi)
+    return ax.counts
+
+
+def reference_counts(arr, bins, lo, hi):
+    """np.histogram with the same effective range _bar_hist uses"""
+    arr = np.asarray(arr, dtype=np.float64)
+    if lo is None:
+        lo = float(arr.min())
+    if hi is None:
+        hi = float(arr.max())
+    if hi <= lo:
+        hi = lo + 1.0
+    return np.histogram(arr, bins=bins, range=(lo, hi))[0]
+
+
+def test_cases():
+    """Data sets exercising top-edge ties, defaults and constant arrays"""
+    rng = np.random.default_rng(45)
+    # (arr, bins, lo, hi)
+    yield np.array([0.0, 0.5, 1.0, 1.0, 1.0]), 4, 0.0, 1.0
+    yield rng.uniform(0, 100, 500), 30, None, None
+    # Integer-valued percentages: many exact ties, including at the max
+    yield rng.integers(0, 101, 500).astype(np.float64), 20, None, None
+    losses = rng.uniform(80, 90, 300)
+    yield losses, 20, float(losses.min()), float(losses.max())
+    yield np.full(50, 86.0), 10, None, None  # constant: hi collapses to lo
+
+
+def test_bar_hist_matches_np_histogram():
+    """Both _bar_hist branches vs np.histogram, all samples counted"""
+    print("Test 1: _bar_hist counting paths vs np.histogram")
+    saved = gpf.histogram1d
+    if saved is None:
+        print("  (fast_histogram not installed; fast path skipped)")
+    # Once with histogram1d (when installed), once forced onto the
+    # NumPy bincount fallback
+    for branch in dict.fromkeys([saved, None]):
+        gpf.histogram1d = branch
+        try:
+            for arr, bins, lo, hi in test_cases():
+                got = bar_hist_counts(arr, bins, lo, hi)
+                expected = reference_counts(arr, bins, lo, hi)
+                assert np.array_equal(got, expected), (
+                    branch is not None, bins, lo, hi, got, expected)
+                assert got.sum() == len(arr), (
+                    branch is not None, bins, lo, hi, got.sum(), len(arr))
+        finally:
+            gpf.histogram1d = saved
+    print("  ✓ PASSED")
+    print()
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("HISTOGRAM FAST-PATH EQUIVALENCE")
+    print("=" * 70)
+    print()
+    test_bar_hist_matches_np_histogram()
+    print("=" * 70)
+    print("ALL EQUIVALENCE CHECKS PASSED ✓")
+    print("=" * 70)
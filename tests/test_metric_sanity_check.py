@@ -24,7 +24,7 @@ from datetime import datetime
 parent_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(parent_dir))
 
-from validate_dimensional_cascade_unified import PhiCalculator
+from validate_dimensional_cascade_multisize import PhiCalculator
 
 
 def test_edge_cases():